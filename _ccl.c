@@ -0,0 +1,135 @@
+/*
+ * C implementation of the solvability check used by Grid.is_impossible
+ * and of the static-order backtracking search, for deployments where
+ * Numba is not available. Same algorithms as the compiled kernels in
+ * grid.py / solve_nb.py: an iterative DFS over the dense neighbor
+ * arrays, checking that every group of connected free cells has a size
+ * multiple of 5, and an explicit backtracking loop over the placement
+ * table.
+ *
+ * Compiled on demand by grid.py (see _load_ccl) and called via ctypes.
+ */
+
+#include <stdint.h>
+#include <string.h>
+
+#define MAX_CELLS 1024
+#define MAX_PIECES 16
+#define FREE 0
+
+int is_impossible(const int64_t *grid, const int8_t *nb_arr,
+                  const int8_t *nb_cnt, int n_cells)
+{
+    uint8_t visited[MAX_CELLS];
+    int32_t stack[MAX_CELLS];
+
+    if (n_cells > MAX_CELLS)
+        return -1;
+    memset(visited, 0, n_cells);
+
+    for (int c = 0; c < n_cells; c++) {
+        if (grid[c] != FREE || visited[c])
+            continue;
+
+        visited[c] = 1;
+        stack[0] = c;
+        int sp = 1;
+        int count = 0;
+        while (sp) {
+            int cc = stack[--sp];
+            count++;
+            for (int k = 0; k < nb_cnt[cc]; k++) {
+                int nb = nb_arr[cc * 6 + k];
+                if (grid[nb] == FREE && !visited[nb]) {
+                    visited[nb] = 1;
+                    stack[sp++] = nb;
+                }
+            }
+        }
+        /* Check group size */
+        if (count % 5 != 0)
+            return 1;
+    }
+    return 0;
+}
+
+/*
+ * Static-order backtracking search over the placement table. Mirror of
+ * the compiled kernel in solve_nb.py: kinds[d] is the piece type at
+ * depth d, placements of type t are rows kind_start[t] to
+ * kind_start[t+1] of p_cells (5 linear cell ids per row), and the first
+ * piece only scans root_start to root_stop (restricted by the caller on
+ * symmetric problems). After each placement past check_at the
+ * solvability check above prunes dead subtrees.
+ *
+ * Returns 1 and fills chosen[0..n_pieces) with the winning rows on
+ * success, 0 when there is no solution, -1 on a bad argument.
+ */
+int solve(int64_t *grid, const int32_t *kinds, int n_pieces, int check_at,
+          int root_start, int root_stop,
+          const int32_t *p_cells, const int32_t *kind_start,
+          const int8_t *nb_arr, const int8_t *nb_cnt, int n_cells,
+          int32_t *chosen)
+{
+    int32_t cursor[MAX_PIECES];
+
+    if (n_pieces == 0)
+        return 1;
+    if (n_pieces > MAX_PIECES || n_cells > MAX_CELLS)
+        return -1;
+
+    if (check_at <= 0 && is_impossible(grid, nb_arr, nb_cnt, n_cells))
+        return 0;
+
+    int index = 0;
+    cursor[0] = root_start;
+
+    for (;;) {
+        int kind = kinds[index];
+        int i = cursor[index];
+        int end = index == 0 ? root_stop : kind_start[kind + 1];
+        int placed = 0;
+
+        while (i < end) {
+            const int32_t *cells = p_cells + (size_t)i * 5;
+            int fits = 1;
+            for (int k = 0; k < 5; k++) {
+                if (grid[cells[k]] != FREE) {
+                    fits = 0;
+                    break;
+                }
+            }
+            if (fits) {
+                for (int k = 0; k < 5; k++)
+                    grid[cells[k]] = kind;
+                if (index + 1 >= check_at &&
+                    is_impossible(grid, nb_arr, nb_cnt, n_cells)) {
+                    for (int k = 0; k < 5; k++)
+                        grid[cells[k]] = FREE;
+                } else {
+                    placed = 1;
+                    break;
+                }
+            }
+            i++;
+        }
+
+        if (placed) {
+            cursor[index] = i;
+            chosen[index] = i;
+            index++;
+            if (index == n_pieces)
+                return 1; /* Solved */
+            cursor[index] = kind_start[kinds[index]];
+        } else {
+            /* No (more) placements fit at this depth: backtrack */
+            index--;
+            if (index < 0)
+                return 0;
+            const int32_t *cells = p_cells + (size_t)cursor[index] * 5;
+            for (int k = 0; k < 5; k++)
+                grid[cells[k]] = FREE;
+            cursor[index]++;
+        }
+    }
+}
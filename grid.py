@@ -1,14 +1,14 @@
 from typing import Iterable, Union
 import numpy as np
 
-import matplotlib.pyplot as plt
-from matplotlib.patches import RegularPolygon
+from scipy import ndimage
 
-from pieces import Piece, NUM_PIECES, movement_dict
+from pieces import Piece, N, NUM_PIECES, get_piece, movement_dict, rot_list
 
-
-# Grid size (including hidden cells)
-N = 11
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Hexagon's apotheme (used for plotting)
 APOTHEME = np.sin(np.radians(60))
@@ -29,13 +29,172 @@ color_map = {
 }
 
 
-# Pre-computed list of allowed values for the x coordinate and list of allowed 
-# values for the y coordinate, given an x coordinate
-allowed_xs_list = list(range(1, 10))
-allowed_ys_lists = [
-	list(range(max(6 - x, 1), 10 - max(0, x - 5)))
+# Pre-computed allowed values for the x coordinate and allowed values for
+# the y coordinate, given an x coordinate. Tuples: iterated in solver loops,
+# never mutated
+allowed_xs_list = tuple(range(1, 10))
+allowed_ys_lists = tuple(
+	tuple(range(max(6 - x, 1), 10 - max(0, x - 5)))
 	for x in allowed_xs_list
-]
+)
+
+# The (x, y) enumeration above flattened into a single tuple of pairs, to
+# spare one nested loop header when scanning every candidate position
+xy_pairs = tuple(
+	(x, y) for x in allowed_xs_list for y in allowed_ys_lists[x-1]
+)
+
+
+def _make_impossible_dfs():
+    """
+    Compiles (with Numba) the depth-first searches used by `is_impossible`.
+
+    The kernels work on the flattened grid and on the dense neighbor arrays
+    (see `Grid.__init_neighbors_lists`), so the whole search runs as a
+    typed loop with no per-cell Python work. One kernel scans the whole
+    grid; the other only the components around a set of seed cells. Returns
+    (None, None) when Numba is not available, in which case `is_impossible`
+    falls back to scipy.
+    """
+    if njit is None:
+        return None, None
+
+    @njit(cache=True)
+    def _flood_size(grid_flat, nb_arr, nb_cnt, stack, visited, gen, c):
+        """Marks the free group containing `c` and returns its size."""
+        visited[c] = gen
+        stack[0] = c
+        sp = 1
+        count = 0
+        while sp:
+            sp -= 1
+            cc = stack[sp]
+            count += 1
+            for k in range(nb_cnt[cc]):
+                nb = nb_arr[cc, k]
+                if grid_flat[nb] == FREE and visited[nb] != gen:
+                    visited[nb] = gen
+                    stack[sp] = nb
+                    sp += 1
+        return count
+
+    @njit(cache=True)
+    def _impossible_dfs(grid_flat, nb_arr, nb_cnt, stack, visited, gen):
+        for c in range(grid_flat.shape[0]):
+            if grid_flat[c] != FREE or visited[c] == gen:
+                continue
+            count = _flood_size(
+                grid_flat, nb_arr, nb_cnt, stack, visited, gen, c
+            )
+            if count % 5 != 0:
+                return True
+        return False
+
+    @njit(cache=True)
+    def _impossible_dfs_seeded(
+        grid_flat, nb_arr, nb_cnt, stack, visited, gen, seeds
+    ):
+        # Only the groups containing or touching a seed cell are checked
+        for si in range(seeds.shape[0]):
+            s = seeds[si]
+            if grid_flat[s] == FREE and visited[s] != gen:
+                count = _flood_size(
+                    grid_flat, nb_arr, nb_cnt, stack, visited, gen, s
+                )
+                if count % 5 != 0:
+                    return True
+            for k in range(nb_cnt[s]):
+                c = nb_arr[s, k]
+                if grid_flat[c] != FREE or visited[c] == gen:
+                    continue
+                count = _flood_size(
+                    grid_flat, nb_arr, nb_cnt, stack, visited, gen, c
+                )
+                if count % 5 != 0:
+                    return True
+        return False
+
+    return _impossible_dfs, _impossible_dfs_seeded
+
+
+_impossible_dfs, _impossible_dfs_seeded = _make_impossible_dfs()
+
+
+def _load_ccl():
+    """
+    Loads the C implementations of the solvability check and of the
+    static-order search (see _ccl.c), compiling the shared object next to
+    the source on first use. Used as a fallback when Numba is not
+    available; returns (None, None) when no C compiler is found either.
+    """
+    import ctypes
+    import os
+    import subprocess
+
+    src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_ccl.c")
+    lib = src[:-2] + ".so"
+    if (
+        not os.path.exists(lib)
+        or os.path.getmtime(lib) < os.path.getmtime(src)
+    ):
+        cc = os.environ.get("CC", "cc")
+        try:
+            subprocess.run(
+                [cc, "-O3", "-march=native", "-shared", "-fPIC", src,
+                 "-o", lib],
+                check=True,
+                capture_output=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None, None
+
+    try:
+        cdll = ctypes.CDLL(lib)
+        imp_fn, solve_fn = cdll.is_impossible, cdll.solve
+    except (OSError, AttributeError):
+        return None, None
+    imp_fn.restype = ctypes.c_int
+    imp_fn.argtypes = [ctypes.c_void_p] * 3 + [ctypes.c_int]
+    solve_fn.restype = ctypes.c_int
+    solve_fn.argtypes = (
+        [ctypes.c_void_p, ctypes.c_void_p]
+        + [ctypes.c_int] * 4
+        + [ctypes.c_void_p] * 4
+        + [ctypes.c_int, ctypes.c_void_p]
+    )
+    return imp_fn, solve_fn
+
+
+_ccl_impossible, _ccl_solve = (
+    _load_ccl() if _impossible_dfs is None else (None, None)
+)
+
+
+# Mask of all the cells of the grid matrix, in the bitboard layout
+_FULL_BOARD_BITS = (1 << (N * N)) - 1
+
+# In the `y * N + x` bitboard layout the six hexagonal directions are
+# uniform bit shifts: +-1 (left/right), +-N (vertical) and +-(N-1) (the two
+# diagonal neighbors). Shifts that fall off the playable region always land
+# on perimeter or hidden cells, so masking with the free cells is enough
+_HEX_SHIFTS = (1, N - 1, N)
+
+
+def _expand_bits(region: int) -> int:
+    """Grows a cell region (as a bitboard) by its hexagonal neighbors."""
+    grown = region
+    for shift in _HEX_SHIFTS:
+        grown |= (region << shift) | (region >> shift)
+    return grown
+
+
+# Base grid layout, built once on first use (see Grid.__init_grid)
+_BASE_GRID = None
+
+# Neighbor structures, built once on first use and shared (read-only) by all
+# grids (see Grid.__init_neighbors_lists)
+_NB_ARR = None
+_NB_CNT = None
 
 
 
@@ -53,18 +212,48 @@ class Grid:
     to the y axis).
 
     Each cell, has 6 neighbors (except for the one on the perimeter). The 
-    perimeter of the grid is blocked, making the actual playable grid having 5 
-    cells per side. 
+    perimeter of the grid is blocked, making the actual playable grid having 5
+    cells per side.
     """
 
+    # Structuring element encoding the hexagonal adjacency on the matrix
+    # representation. Out of the 8 neighbors of the square stencil, the two
+    # "opposite corners" are not hexagonal neighbors (see pieces.movement_dict)
+    HEX_STRUCTURE = np.array(
+        [[0, 1, 1],
+         [1, 1, 1],
+         [1, 1, 0]],
+        dtype=bool,
+    )
+
     def __init__(
         self,
         cmap_name: str = "inferno",
         pieces: Union[Piece, Iterable[Piece]] = None,
     ):
         self.grid = self.__init_grid()
-        self.neighbors = self.__init_neighbors_lists()
-        self.cmap = plt.get_cmap(cmap_name)
+        # Playability mask: True for cells that are neither hidden nor
+        # blocked. Occupying a cell with a piece does not change it
+        self._valid_mask = (self.grid != HIDDEN) & (self.grid != BLOCKED)
+        self.__init_neighbors_lists()
+        # Bitboard (one bit per cell, indexed as `y * N + x`) of the cells
+        # occupied by pieces, plus the mask of the cells that can never be
+        # occupied (hidden and blocked ones)
+        self.bitboard = 0
+        self._blocked_bits = 0
+        for idx in np.flatnonzero(self.grid.ravel() != FREE):
+            self._blocked_bits |= 1 << int(idx)
+        # Reusable DFS stack (cells encoded as `y * N + x`), so the search
+        # kernel does not allocate one per call. The visited buffer uses a
+        # generation counter, so it does not even need to be cleared between
+        # calls: a cell is visited iff its entry equals the current generation
+        self._stack = np.empty(N * N, dtype=np.int32)
+        self._visited = np.zeros(N * N, dtype=np.uint16)
+        self._gen = 0
+        # The colormap (and matplotlib itself) is only loaded on the first
+        # draw, so solver-only runs never pay for it
+        self._cmap_name = cmap_name
+        self.cmap = None
         if pieces is not None:
             self.add_pieces(pieces)
 
@@ -74,54 +263,68 @@ class Grid:
         """
         Initializes the grid. No piece or contrain is added. Only the base,
         unchanging structure.
+
+        The layout is derived in closed form: the playable cells are the
+        ones in `allowed_xs_list`/`allowed_ys_lists`, the blocked perimeter
+        is their hexagonal dilation, and everything else is hidden. The
+        result is computed once and cached, so each Grid() only pays for a
+        copy.
         """
-        grid = np.full((N, N), FREE, dtype=int)
-        # Fill Bottom row
-        grid[0, :] = HIDDEN
-        grid[0, -6:] = BLOCKED
-        
-        # Fill bottom half
-        for r, c in enumerate(range(4, -1, -1)):
-            grid[r+1, :c] = HIDDEN
-            grid[r+1, c] = BLOCKED
-            grid[r+1, -1] = BLOCKED
-
-        # Fill top row
-        grid[-1, :] = HIDDEN
-        grid[-1, :6] = BLOCKED
-
-        # Fill top half
-        for r, c in enumerate(range(6, 1, -1)):
-            rr = -(r+1)
-            grid[rr, -c:] = HIDDEN
-            grid[rr, -c] = BLOCKED
-            grid[rr, 0] = BLOCKED
-        
-        return grid
-    
+        global _BASE_GRID
+        if _BASE_GRID is None:
+            ys, xs = np.ogrid[:N, :N]
+            valid = (
+                (xs >= 1) & (xs <= 9) &
+                (ys >= np.maximum(6 - xs, 1)) &
+                (ys < 10 - np.maximum(0, xs - 5))
+            )
+            blocked = (
+                ndimage.binary_dilation(valid, structure=Grid.HEX_STRUCTURE)
+                & ~valid
+            )
+            grid = np.full((N, N), HIDDEN, dtype=int)
+            grid[valid] = FREE
+            grid[blocked] = BLOCKED
+            _BASE_GRID = grid
+        return _BASE_GRID.copy()
+
 
     def __init_neighbors_lists(self):
         """
-        Initializes the list of neighboring cells for each cell. Needed for 
-        the feasibility check.
-        """
-        neighbors = np.empty((N, N), dtype=object)
-        for x in allowed_xs_list:
-            for y in allowed_ys_lists[x-1]:
-                neighbors[y, x] = [
-                    (x + mx, y + my)
-                    for mx, my in movement_dict.values()
-                    if self._is_point_valid(x + mx, y + my)
-                ]
-        return neighbors
+        Initializes the neighbors of each cell, as a dense `(N*N, 6)` int8
+        array (cells encoded as `y * N + x`, rows padded with -1) plus a
+        per-cell neighbor count. Needed for the feasibility check. A cell
+        has at most 6 hexagonal neighbors, so the fixed stride is exact.
+
+        The adjacency only depends on the base layout, so it is built once
+        and shared (read-only) by all grids.
+        """
+        global _NB_ARR, _NB_CNT
+        if _NB_ARR is None:
+            nb_arr = np.full((N * N, 6), -1, dtype=np.int8)
+            nb_cnt = np.zeros(N * N, dtype=np.int8)
+            for x in allowed_xs_list:
+                for y in allowed_ys_lists[x-1]:
+                    c = y * N + x
+                    for mx, my in movement_dict.values():
+                        if self._is_point_valid(x + mx, y + my):
+                            nb_arr[c, nb_cnt[c]] = (y + my) * N + (x + mx)
+                            nb_cnt[c] += 1
+
+            _NB_ARR = nb_arr
+            _NB_CNT = nb_cnt
+
+        self._nb_arr = _NB_ARR
+        self._nb_cnt = _NB_CNT
     
     
     def _is_point_safe(self, x: int, y: int) -> bool:
         """
-        Checks whether the given coordinates do not go outside the grid matrix 
-        limits.
+        Checks whether the given coordinates do not go outside the grid matrix
+        limits. Negative coordinates are caught in one go by OR-ing the sign
+        bits.
         """
-        return (0 <= x < N) and (0 <= y < N)
+        return (x | y) >= 0 and x < N and y < N
 
     def _is_point_free(self, x: int, y: int) -> bool:
         """Checks whether the given coordinates are free."""
@@ -134,39 +337,110 @@ class Grid:
         """Checks whether the given coordinates are valid for the game."""
         return (
             self._is_point_safe(x, y) and
-            self.grid[y, x] not in (HIDDEN, BLOCKED)
+            bool(self._valid_mask[y, x])
         )
 
 
-    def is_impossible(self):
+    def block_cell(self, x: int, y: int):
+        """Marks a single cell as blocked (used to set up a problem)."""
+        self.grid[y, x] = BLOCKED
+        self._valid_mask[y, x] = False
+        self._blocked_bits |= 1 << (y * N + x)
+
+
+    def has_rotational_symmetry(self) -> bool:
+        """
+        Checks whether the blocked cells are invariant under a 120 degrees
+        rotation of the board about its center.
+
+        When this holds, rotating a whole solution by 120 degrees yields
+        another solution in which every piece keeps its position pattern but
+        moves to its next rotation value, so solutions come in orbits of
+        three and a solver may restrict the first placed piece to rotation 0
+        (see `placements_for_piece`).
+        """
+        c = N // 2
+        ys, xs = np.nonzero(self.grid == BLOCKED)
+        # 120 degrees rotation about the center, in the axial coordinates
+        # of this grid: (q, r) -> (-(q + r), q)
+        q, r = xs - c, ys - c
+        rot_xs, rot_ys = c - (q + r), c + q
+        return bool(np.all(self.grid[rot_ys, rot_xs] == BLOCKED))
+
+
+    def is_impossible(self, seed_cells=None):
         """
         Checks whether the current grid configuration allows for solutions.
 
-        This checks whether all the groups of connected free cells are 
-        composed of a number of cells multiple of 5. This assumes all the 
-        pieces are made of 5 components, and that the solution does not have 
+        This checks whether all the groups of connected free cells are
+        composed of a number of cells multiple of 5. This assumes all the
+        pieces are made of 5 components, and that the solution does not have
         empty cells.
-        """
-        to_visit = []
-        _grid = self.grid.copy()
-        for x in allowed_xs_list:
-            for y in allowed_ys_lists[x-1]:
-                if _grid[y, x] != FREE:
-                    continue
 
-                # This is essentially a depth-first search
-                to_visit.extend(self.neighbors[y, x])
-                count = 1
-                _grid[y, x] = VISITED
-                while to_visit:
-                    xn, yn = to_visit.pop()
-                    if _grid[yn, xn] == FREE:
-                        count += 1
-                        _grid[yn, xn] = VISITED
-                        to_visit.extend(self.neighbors[yn, xn])
-                # Check group size
-                if count % 5 != 0:
-                    return True
+        When `seed_cells` is given (an (M, 2) array-like of the (x, y)
+        coordinates that changed since the last check, e.g. the components
+        of the last placed piece), only the free groups touching those
+        cells are re-checked: the other groups cannot have changed. This is
+        only sound if the rest of the grid passed a previous check.
+
+        When Numba is available, the search runs as a compiled DFS over the
+        dense neighbor arrays. Otherwise the same DFS is attempted through
+        the small C extension (see _ccl.c), and as a last resort the
+        groups are grown as a bitboard flood fill on Python ints (see
+        `_is_impossible_bits`), whose cost is a handful of shift/AND ops
+        per group rather than per-cell work. Both fallbacks always scan
+        the full grid, regardless of `seed_cells`.
+        """
+        if _impossible_dfs is not None:
+            self._gen += 1
+            if self._gen == 65536:
+                # Generation counter wrapped around: actually clear the buffer
+                self._visited.fill(0)
+                self._gen = 1
+            if seed_cells is None:
+                return bool(
+                    _impossible_dfs(
+                        self.grid.ravel(), self._nb_arr, self._nb_cnt,
+                        self._stack, self._visited, self._gen,
+                    )
+                )
+            cells = np.asarray(seed_cells, dtype=np.int32)
+            seeds = cells[:, 1] * N + cells[:, 0]
+            return bool(
+                _impossible_dfs_seeded(
+                    self.grid.ravel(), self._nb_arr, self._nb_cnt,
+                    self._stack, self._visited, self._gen, seeds,
+                )
+            )
+        if _ccl_impossible is not None:
+            return bool(_ccl_impossible(
+                self.grid.ctypes.data,
+                self._nb_arr.ctypes.data,
+                self._nb_cnt.ctypes.data,
+                N * N,
+            ))
+        return self._is_impossible_bits()
+
+    def _is_impossible_bits(self) -> bool:
+        """
+        Pure-Python implementation of the solvability check, as a bitboard
+        flood fill: each group of free cells is grown with shift/AND steps
+        until it stops changing, and its size is the mask's popcount. Only
+        register-level integer ops, no per-cell work.
+        """
+        free = _FULL_BOARD_BITS & ~(self.bitboard | self._blocked_bits)
+        while free:
+            # Flood the group containing the lowest free cell
+            group = free & -free
+            while True:
+                grown = _expand_bits(group) & free
+                if grown == group:
+                    break
+                group = grown
+            # Check group size
+            if group.bit_count() % 5 != 0:
+                return True
+            free &= ~group
         return False
 
 
@@ -174,14 +448,21 @@ class Grid:
         """
         Adds a piece to the grid.
         
-        If at least one of the piece's components would end up in an invalid 
-        or already occupied position, the piece is not inserted and `False` is 
+        If at least one of the piece's components would end up in an invalid
+        or already occupied position, the piece is not inserted and `False` is
         returned. Otherwise, the grid is updated and `True` is returned.
+
+        The check is a single bitwise test of the piece's pre-computed mask
+        against the occupancy bitboard.
         """
-        if not all(self._is_point_free(x, y) for x, y in piece):
+        if (self.bitboard | self._blocked_bits) & piece.bits:
             return False
-        for x, y in piece:
-            self.grid[y, x] = piece.index
+        self.bitboard |= piece.bits
+        # Mirror into the matrix (still used for drawing and for the
+        # solvability check) with one fancy-indexed write. The mask test
+        # already guarantees all the components are in bounds
+        pts = piece.points
+        self.grid[pts[:, 1], pts[:, 0]] = piece.index
         return True
 
     def add_pieces(self, pieces: Iterable[Piece]) -> bool:
@@ -194,6 +475,29 @@ class Grid:
                 return False
         return True
 
+    def add_placement(self, i: int) -> bool:
+        """
+        Adds the placement with index `i` in the module-level placement
+        table. Same semantics as `add_piece`, but without constructing a
+        `Piece` object.
+        """
+        bits = PLACEMENT_BITS[i]
+        if (self.bitboard | self._blocked_bits) & bits:
+            return False
+        self.bitboard |= bits
+        cells = PLACEMENT_CELLS[i]
+        self.grid[cells[:, 1], cells[:, 0]] = PLACEMENT_PIECE_IDX[i]
+        return True
+
+    def remove_placement(self, i: int):
+        """
+        Removes the placement with index `i` in the module-level placement
+        table. Same semantics as `remove_piece`.
+        """
+        self.bitboard &= ~PLACEMENT_BITS[i]
+        cells = PLACEMENT_CELLS[i]
+        self.grid[cells[:, 1], cells[:, 0]] = FREE
+
     def remove_piece(self, piece: Piece):
         """
         Removes a piece from the grid.
@@ -203,46 +507,188 @@ class Grid:
         operation (for performance reasons).
         """
         # assert all(self._is_point_valid(x, y) for x, y in piece)
-        for x, y in piece:
-            self.grid[y, x] = FREE
+        self.bitboard &= ~piece.bits
+        pts = piece.points
+        self.grid[pts[:, 1], pts[:, 0]] = FREE
     
 
     def draw(self, ax=None, show_hidden: bool = False):
-        """Draws the grid."""
+        """
+        Draws the grid.
+
+        All the cell hexagons are built in one vectorized pass and added to
+        the axis as a single `PolyCollection`; only the piece labels still
+        need a (small) Python loop.
+        """
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import PolyCollection
+        from matplotlib.colors import to_rgba
+
+        if self.cmap is None:
+            self.cmap = plt.get_cmap(self._cmap_name)
         if ax is None:
             ax = plt.gca()
-        
-        for row in range(N):
-            y = 1.5 * row
-            start_x = row * APOTHEME
-            for col in range(N):
-                x = start_x + 2 * APOTHEME * col
-                val = self.grid[row, col]
-                if val == HIDDEN and not show_hidden:
-                    continue
 
-                if val <= 0:
-                    color = color_map[val]
-                else:
-                    color = self.cmap(val / NUM_PIECES)
-
-                hex = RegularPolygon(
-                    (x, y),
-                    numVertices=6,
-                    radius=1,
-                    facecolor=color,
-                    alpha=0.7,
-                    edgecolor='black'
-                )
-                ax.add_patch(hex)
-
-                if val > 0:
-                    ax.text(
-                        x, y,
-                        str(self.grid[row, col]),
-                        horizontalalignment="center",
-                        verticalalignment="center",
-                        fontsize=12,
-                        color="black" if val >= 4 else "white",
-                    )
+        rows, cols = np.indices((N, N))
+        rows, cols = rows.ravel(), cols.ravel()
+        vals = self.grid.ravel()
+        if not show_hidden:
+            keep = vals != HIDDEN
+            rows, cols, vals = rows[keep], cols[keep], vals[keep]
+
+        # Cell centers and unit-hexagon vertices (one vertex pointing up,
+        # like RegularPolygon's default orientation)
+        centers = np.column_stack((
+            APOTHEME * (rows + 2 * cols),
+            1.5 * rows,
+        ))
+        angles = np.pi / 3 * np.arange(6) + np.pi / 6
+        hexagon = np.column_stack((np.cos(angles), np.sin(angles)))
+        verts = centers[:, None, :] + hexagon[None, :, :]
+
+        colors = self.cmap(vals / NUM_PIECES)
+        for val, color in color_map.items():
+            colors[vals == val] = to_rgba(color)
+
+        ax.add_collection(PolyCollection(
+            verts,
+            facecolors=colors,
+            alpha=0.7,
+            edgecolors="black",
+        ))
+
+        labeled = vals > 0
+        for (x, y), val in zip(centers[labeled], vals[labeled]):
+            ax.text(
+                x, y,
+                str(val),
+                horizontalalignment="center",
+                verticalalignment="center",
+                fontsize=12,
+                color="black" if val >= 4 else "white",
+            )
+
+
+# === Placement table ===
+# Every valid (piece type, base x, base y, rotation) combination is
+# pre-computed once at import time, in a structure-of-arrays layout, so that
+# a solver can enumerate candidate placements by integer index without
+# constructing Piece objects.
+
+def __build_placement_table():
+    base = Grid()
+    base_blocked = base._blocked_bits
+
+    # Compact bit layout: the 61 playable cells, numbered in row-major
+    # order, fit in a single 64-bit word
+    playable = np.flatnonzero(base.grid.ravel() == FREE)
+    compact = np.full(N * N, -1, dtype=np.int64)
+    compact[playable] = np.arange(playable.size)
+
+    cells, bits, bits64, piece_idxs, confs = [], [], [], [], []
+    slices, rot0_slices = {}, {}
+    for index in range(1, NUM_PIECES + 1):
+        start = len(bits)
+        for rot in rot_list:
+            if rot == 1:
+                # Rotations are the outer loop, so the rotation-0
+                # placements are a contiguous prefix of the piece's block
+                rot0_slices[index] = slice(start, len(bits))
+            for x in allowed_xs_list:
+                for y in allowed_ys_lists[x-1]:
+                    piece = get_piece(index, x, y, rot)
+                    if piece.bits == -1 or piece.bits & base_blocked:
+                        continue
+                    cells.append(piece.points)
+                    bits.append(piece.bits)
+                    bits64.append(sum(
+                        1 << int(compact[int(py) * N + int(px)])
+                        for px, py in piece.points
+                    ))
+                    piece_idxs.append(index)
+                    confs.append((x, y, rot))
+        slices[index] = slice(start, len(bits))
+
+    return (
+        np.array(cells, dtype=np.int8),
+        bits,
+        np.array(bits64, dtype=np.uint64),
+        np.array(piece_idxs, dtype=np.uint8),
+        np.array(confs, dtype=np.int8),
+        playable,
+        slices,
+        rot0_slices,
+    )
+
+# Cells as (x, y) pairs of each placement's components, bitboard masks (as
+# Python ints in the Grid.bitboard layout, and as uint64 in the compact
+# playable-cells layout), piece type index and (base_x, base_y, rotation)
+# configuration of each placement
+(
+    PLACEMENT_CELLS,
+    PLACEMENT_BITS,
+    PLACEMENT_BITS64,
+    PLACEMENT_PIECE_IDX,
+    PLACEMENT_CONF,
+    _PLAYABLE_CELLS,
+    __placement_slices,
+    __rot0_slices,
+) = __build_placement_table()
+
+
+def placements_for_piece(index: int, first_rotation_only: bool = False) -> slice:
+    """
+    Returns the slice of the placement table for piece type `index`.
+
+    With `first_rotation_only`, the slice is restricted to the placements
+    with rotation 0. On a problem with rotational symmetry (see
+    Grid.has_rotational_symmetry) the first placed piece can be limited to
+    these without losing solutions, pruning the root fan-out threefold.
+    """
+    if first_rotation_only:
+        return __rot0_slices[index]
+    return __placement_slices[index]
+
+
+def placement_piece(i: int) -> Piece:
+    """Builds the concrete `Piece` for placement `i` in the table."""
+    x, y, rot = (int(v) for v in PLACEMENT_CONF[i])
+    return get_piece(int(PLACEMENT_PIECE_IDX[i]), x, y, rot)
+
+
+def occupancy_bits64(grid: Grid) -> np.uint64:
+    """
+    Returns the occupied (or blocked) playable cells of `grid` as a single
+    uint64, in the same compact layout as `PLACEMENT_BITS64`.
+    """
+    occupied = np.flatnonzero(grid.grid.ravel()[_PLAYABLE_CELLS] != FREE)
+    # The bits are distinct powers of two, so the sum is their union
+    return np.sum(
+        np.uint64(1) << occupied.astype(np.uint64), dtype=np.uint64
+    )
+
+
+def feasible_placements(grid: Grid) -> np.ndarray:
+    """
+    Returns the boolean mask, over the placement table, of the placements
+    that fit the current grid configuration, computed with one vectorized
+    bitwise test.
+
+    E.g., `np.bincount(PLACEMENT_PIECE_IDX[feasible_placements(grid)])`
+    counts the remaining placements per piece type, which can be used for
+    minimum-remaining-values style branching.
+    """
+    return (PLACEMENT_BITS64 & occupancy_bits64(grid)) == 0
+
+
+def __build_cell_placements():
+    cell_pl = {int(c): [] for c in _PLAYABLE_CELLS}
+    for i, pts in enumerate(PLACEMENT_CELLS):
+        for x, y in pts:
+            cell_pl[int(y) * N + int(x)].append(i)
+    return {c: tuple(v) for c, v in cell_pl.items()}
 
+# Table indexes of the placements covering each playable cell, keyed by
+# linear cell id (`y * N + x`). Used for cell-based (most-constrained
+# variable) branching: the placements that can still fill a given cell
+CELL_PLACEMENTS = __build_cell_placements()
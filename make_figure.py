@@ -3,7 +3,7 @@ import argparse
 import matplotlib.pyplot as plt
 import yaml
 
-from grid import BLOCKED, Grid
+from grid import Grid
 from pieces import get_piece
 
 
@@ -31,8 +31,8 @@ def load_solution(filename: str) -> Grid:
     
     grid = Grid()
     for x, y in problem_conf["blocked_grid_cells"]:
-        grid.grid[y, x] = BLOCKED
-        
+        grid.block_cell(x, y)
+
     for index, piece_conf in problem_conf["solution"].items():
         piece = get_piece(index, **piece_conf)
         if not grid.add_piece(piece):
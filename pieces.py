@@ -10,9 +10,16 @@ attributes.
 
 import sys
 
+import numpy as np
+
 
 NUM_PIECES = 12
 
+# Size of the grid matrix, including hidden cells. Defined here (and
+# re-exported by grid.py) so that pieces can pre-compute their bitboard
+# masks without importing the grid module.
+N = 11
+
 
 # Relative position (x, y) of the 6 neighbors of a cell
 movement_dict = {
@@ -25,8 +32,8 @@ movement_dict = {
 }
 
 
-# Pre-computed list of possible piece rotations
-rot_list = list(range(3))
+# Pre-computed possible piece rotations
+rot_list = (0, 1, 2)
 
 
 
@@ -53,13 +60,44 @@ class Piece:
         self.base_y = base_y
         self.rotation = rotation % 3
         self.__make_coords()
-    
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Converts the subclass's `movements` to a (3, 5, 2) int8 array and
+        gives it its own coordinates cache (see `__make_coords`).
+        """
+        super().__init_subclass__(**kwargs)
+        cls.movements = np.asarray(cls.movements, dtype=np.int8)
+        cls._coords_cache = {}
+
     def __make_coords(self):
-        """Pre-computes the concrete coordinates for the piece's components."""
-        self.points = [
-            (self.base_x + x, self.base_y + y)
-            for x, y in self.movements[self.rotation]
-        ]
+        """
+        Pre-computes the concrete coordinates for the piece's components, as
+        a (5, 2) array of (x, y) pairs, and the corresponding bitboard mask
+        (one bit per grid cell, indexed as `y * N + x`).
+
+        The results are memoized per (base_x, base_y, rotation) on the
+        concrete class, so repeated constructions of the same configuration
+        (as done by `make_new` in a solver loop) share the same read-only
+        array instead of recomputing it.
+        """
+        key = (self.base_x, self.base_y, self.rotation)
+        cached = self._coords_cache.get(key)
+        if cached is None:
+            points = self.movements[self.rotation] + np.array(
+                (self.base_x, self.base_y), dtype=np.int8
+            )
+            bits = 0
+            for x, y in points:
+                if 0 <= x < N and 0 <= y < N:
+                    bits |= 1 << (int(y) * N + int(x))
+                else:
+                    # Components outside the grid matrix: use an all-ones
+                    # mask so that any overlap test against the grid fails
+                    bits = -1
+                    break
+            cached = self._coords_cache[key] = (points, bits)
+        self.points, self.bits = cached
     
     def __str__(self) -> str:
         """To-string magic method."""
@@ -71,8 +109,29 @@ class Piece:
         )
 
     def __iter__(self):
-        """Iterator over piece's components."""
-        return iter(self.points)
+        """Iterator over piece's components, as (x, y) tuples."""
+        return map(tuple, self.points)
+
+    def reset_to(self, x: int, y: int, rot: int):
+        """
+        Moves this piece, in place, to the given base coordinates and
+        rotation. Cheaper than `make_new` when scanning many candidate
+        configurations: the same object is reused and the coordinates come
+        from the memoized cache.
+
+        Args:
+            x (int): New base's x coordinate
+            y (int): New base's y coordinate
+            rot (int): New rotation
+        """
+        self.base_x = x
+        self.base_y = y
+        self.rotation = rot % 3
+        self.__make_coords()
+
+    def clone(self) -> "Piece":
+        """Makes a copy of this piece (same type, position and rotation)."""
+        return type(self)(self.base_x, self.base_y, self.rotation)
 
     def make_new(self, x: int, y: int, rot: int) -> "Piece":
         """
@@ -92,9 +151,7 @@ class Piece:
 
 def get_piece(idx: int, *args, **kwargs) -> Piece:
     """Makes a new Piece of type `idx`."""
-    _name = "Piece" + str(idx)
-    _class = getattr(sys.modules[__name__], _name)
-    return _class(*args, **kwargs)
+    return _PIECE_CLASSES[idx](*args, **kwargs)
 
 
 
@@ -285,3 +342,11 @@ class Piece12(Piece):
     ]
     def __init__(self, base_x: int = 0, base_y: int = 0, rotation: int = 0):
         super().__init__(12, base_x, base_y, rotation)
+
+
+# Dispatch table from piece type index to concrete class, so that get_piece
+# does not have to look the class up on the module at every call
+_PIECE_CLASSES = {
+    index: getattr(sys.modules[__name__], f"Piece{index}")
+    for index in range(1, NUM_PIECES + 1)
+}
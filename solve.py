@@ -1,266 +1,574 @@
-import argparse
-import random
-import time
-from typing import List, Optional, Tuple
-
-import yaml
-
-import matplotlib.pyplot as plt
-
-
-from grid import (
-    allowed_xs_list,
-    allowed_ys_lists,
-    BLOCKED,
-    Grid,
-)
-
-from pieces import get_piece, NUM_PIECES, Piece, rot_list
-
-
-
-def solve_recursive(
-    grid: Grid,
-    pieces: List[Piece],
-    index: int = 0,
-    check_at: int = 3,
-) -> bool:
-    """
-    Recursive function to solve a problem.
-
-    The idea is that, once a piece is positioned, the problem becomes an 
-    easier problem, with one piece left and a different starting grid.
-
-    This function, given a grid state (with possibly some piece already 
-    positioned) and a piece (as an index in a list of pieces), tries to find a
-    valid position for the piece. Once this is found, it recusively call itself.
-
-    In case the problem is solved, the grid will contain the configuration of 
-    pieces (i.e. each cell will contain the index of the piece occupying it), 
-    while `pieces` will contain the concrete pieces that solve the problem.
-
-    Args:
-        grid (Grid): Problem grid.
-        pieces (list): List of pieces for the problem.
-        index (int): Index (in the list) of the current piece.
-        check_at (int): Index from which checking if the grid is solvable 
-            See grid.is_impossible() for details.
-    
-    Returns:
-        True if the problem can be solved. False otherwise.
-    """
-    if index == len(pieces):
-        # No more pieces to position => Solved!
-        return True
-    
-    if index >= check_at and grid.is_impossible():
-        return False
-
-    for rot in rot_list:
-        for x in allowed_xs_list:
-            for y in allowed_ys_lists[x-1]:
-                piece = pieces[index].make_new(x, y, rot)
-
-                if grid.add_piece(piece):
-                    if solve_recursive(grid, pieces, index + 1, check_at):
-                        pieces[index] = piece
-                        return True
-
-                    grid.remove_piece(piece)
-
-    return False
-
-
-
-# === Iterative solver ===
-# Initial tests didn't show much advantage in avoiding recursion.
-# Hence, this might not work now.
-
-def config_gen(piece):
-    for rot in rot_list:
-        for x in allowed_xs_list:
-            for y in allowed_ys_lists[x-1]:
-                yield piece.make_new(x, y, rot)
-
-def search_piece_position(grid, generator):
-    for piece in generator:
-        if grid.add_piece(piece):
-            return piece, generator
-    return None
-
-
-def solve_iter(grid, pieces, check_at=5) -> bool:
-    generators = [config_gen(piece) for piece in pieces]
-    idx = 0
-
-    while idx < len(pieces):
-        piece, gen = pieces[idx], generators[idx]
-        res = search_piece_position(grid, gen)
-
-        if res is not None:
-            # If a position is found
-            if idx >= check_at and grid.check_isolated():
-                grid.remove_piece(res[0])
-                continue
-
-            pieces[idx] = res[0]
-            generators[idx] = res[1]
-            idx += 1
-
-        else:
-            # If no position is found
-            if idx == 0:
-                return False
-
-            generators[idx] = config_gen(piece)
-            idx -= 1
-            grid.remove_piece(pieces[idx])
-
-    return True
-
-# === Iterative solver ===
-
-
-
-def prepare_problem(filename: str) -> Tuple[Grid, List[Piece]]:
-    """
-    Loads a problem from a YAML configuration file.
-
-    The config file should contain the following entries:
-
-    - 'blocked_grid_cells': This should be a list of (x, y) couples 
-      corresponding to the x and y coordinates of the blocked grid cells.
-
-    - 'excluded_pieces': This should be a list of indexes corresponding to the 
-      indexes of the pieces that should be excluded when solving the problem.
-      Can be empty.
-
-    Args:
-        filename (str): Configuration file name (yaml).
-    
-    Returns:
-        Grid, List: Starting grid and list of available pieces.
-    """
-    with open(filename, "r") as fp:
-        problem_conf = yaml.safe_load(fp)
-    
-    grid = Grid()
-    for x, y in problem_conf["blocked_grid_cells"]:
-        grid.grid[y, x] = BLOCKED
-    assert not grid.is_impossible()
-
-
-    pieces = [
-        get_piece(i)
-        for i in range(1, NUM_PIECES+1)
-        if i not in problem_conf.get("excluded_pieces", ())
-    ]
-
-    return grid, pieces
-
-
-def save_solution_to_config(pieces: List[Piece], filename: str):
-    """
-    Save a set of pieces as solution in the configuration file. If a solution 
-    already exists in the config file, this does nothing.
-
-    Args:
-        pieces (list): List of pieces (supposedly solving the problem).
-        filename (str): Problem configuration file (yaml).
-    """
-    with open(filename, "r") as fp:
-        problem_conf = yaml.safe_load(fp)
-
-    if not "solution" in problem_conf:
-        solution  = {
-            piece.index: {
-                "base_x": piece.base_x,
-                "base_y": piece.base_y,
-                "rotation": piece.rotation,
-            }
-            for piece in pieces
-        }
-        with open(filename, "a") as fp:
-            yaml.safe_dump({"solution": solution}, fp)
-
-
-
-def solve(
-    filename: str,
-    seed: Optional[int] = None,
-    check_at: int = 3,
-    save_solution: bool = True,
-    use_iterative: bool = False,
-):
-    """
-    Solves a problem.
-
-    The problem is loaded from a configuration file containing the initial 
-    grid configuration (in terms of blocked cells) and the available pieces.
-
-    Args:
-        filename (str): Problem configuration file (yaml).
-        seed (int, optional): Seed for the random number generator. This 
-            influences the order of the pieces. Default: None.
-        check_at (int): Number of pieces placed after which starting to check 
-            if the grid is solvable. Default: 3.
-        save_solution (bool): Whether to save the solution in the input config 
-            file (if not already present). Default: True.
-        use_iterative (bool): Ignored.
-    """
-
-    grid, pieces = prepare_problem(filename)
-    random.seed(seed)
-    random.shuffle(pieces)
-
-    # solver = solve_iter if use_iterative else solve_recursive
-    solver = solve_recursive
-
-    print("Starting to solve problem...")
-    start = time.time()
-    solved = solver(grid, pieces, check_at=check_at)
-    end = time.time()
-    print(f"Ended in: {end - start:.2f} seconds")
-    if not solved:
-        print("The problem could not be solved! :'(")
-    else:
-        print("Problem solved! :D")
-
-    if solved and save_solution:
-        save_solution_to_config(pieces, filename)
-
-    fig, ax = plt.subplots(1, 1, figsize=(6, 6))
-    grid.draw(ax=ax)
-    ax.set(xlim=(2, 23), ylim=(-3, 18))
-    ax.set_aspect("equal")
-    plt.axis("off")
-    plt.tight_layout()
-    plt.show()
-
-
-
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Solves a problem.")
-    parser.add_argument(
-        "config_file", help="Problem configuration file (YAML)"
-    )
-    parser.add_argument(
-        "--seed", type=int, default=None, help="Seed for the piece shuffle"
-    )
-    parser.add_argument(
-        "--check-at", type=int, default=3,
-        help="Index from which checking if the current grid is solvable",
-    )
-    parser.add_argument(
-        "--no-save-solution", action="store_false", dest="save_solution",
-        help="Do not save the solution in the input config file"
-    )
-
-    args = parser.parse_args()
-
-    solve(
-        filename=args.config_file,
-        seed=args.seed,
-        check_at=args.check_at,
-        save_solution=args.save_solution,
-    )
+import argparse
+import random
+import time
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import yaml
+try:
+    # libyaml-backed loader/dumper: same safe behavior, C speed
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
+from grid import (
+    CELL_PLACEMENTS,
+    Grid,
+    PLACEMENT_BITS,
+    PLACEMENT_CELLS,
+    PLACEMENT_PIECE_IDX,
+    placement_piece,
+    placements_for_piece,
+    xy_pairs,
+)
+
+from pieces import get_piece, NUM_PIECES, Piece, rot_list
+
+# Maximum number of known-unsolvable states remembered during a search.
+# Each entry is a (bitboard, remaining-pieces) key; past the cap, new dead
+# ends are simply not recorded
+UNSOLVABLE_CACHE_MAX = 1 << 20
+
+
+
+def solve_recursive(
+    grid: Grid,
+    pieces: List[Piece],
+    index: int = 0,
+    check_at: int = 1,
+    last_placement: Optional[int] = None,
+    sym_break: bool = False,
+    unsolvable: Optional[set] = None,
+) -> bool:
+    """
+    Recursive function to solve a problem.
+
+    The idea is that, once a piece is positioned, the problem becomes an
+    easier problem, with one piece left and a different starting grid.
+
+    This function, given a grid state (with possibly some piece already
+    positioned) and a piece (as an index in a list of pieces), tries to find a
+    valid position for the piece. Once this is found, it recusively call itself.
+
+    The candidate positions come from the flat placement table in grid.py
+    (in the same rotation/x/y order as the old triple loop), so no Piece
+    object is built for rejected candidates.
+
+    In case the problem is solved, the grid will contain the configuration of
+    pieces (i.e. each cell will contain the index of the piece occupying it),
+    while `pieces` will contain the concrete pieces that solve the problem.
+
+    Args:
+        grid (Grid): Problem grid.
+        pieces (list): List of pieces for the problem.
+        index (int): Index (in the list) of the current piece.
+        check_at (int): Index from which checking if the grid is solvable
+            See grid.is_impossible() for details.
+        last_placement (int, optional): Table index of the placement made by
+            the caller. Past the first solvability check, only the free
+            groups around it need to be re-checked.
+        sym_break (bool): Whether the problem has rotational symmetry (see
+            Grid.has_rotational_symmetry). If so, the first piece is only
+            tried with rotation 0, skipping the two rotated copies of every
+            solution.
+        unsolvable (set, optional): Known-unsolvable (bitboard, index)
+            states. The same grid state can be reached by placing the same
+            prefix of pieces in different positions; once it fails, it is
+            recorded here and never re-explored. Created on the first call.
+
+    Returns:
+        True if the problem can be solved. False otherwise.
+    """
+    if index == len(pieces):
+        # No more pieces to position => Solved!
+        return True
+
+    if unsolvable is None:
+        unsolvable = set()
+    key = (grid.bitboard, index)
+    if key in unsolvable:
+        return False
+
+    if index >= check_at and grid.is_impossible(
+        PLACEMENT_CELLS[last_placement]
+        if (last_placement is not None and index > check_at)
+        else None
+    ):
+        return False
+
+    table_range = placements_for_piece(
+        pieces[index].index, first_rotation_only=(sym_break and index == 0)
+    )
+    # Bound methods hoisted out of the candidate loop
+    add_placement, remove_placement = grid.add_placement, grid.remove_placement
+    for i in range(table_range.start, table_range.stop):
+        if add_placement(i):
+            if solve_recursive(
+                grid, pieces, index + 1, check_at, i, sym_break, unsolvable
+            ):
+                pieces[index] = placement_piece(i)
+                return True
+
+            remove_placement(i)
+
+    if len(unsolvable) < UNSOLVABLE_CACHE_MAX:
+        unsolvable.add(key)
+    return False
+
+
+
+# Piece type of each placement, as a one-hot bitmask (for testing against a
+# remaining-pieces mask with a single AND)
+_PLACEMENT_TYPE_BIT = tuple(1 << int(t) for t in PLACEMENT_PIECE_IDX)
+
+
+def solve_mrv(
+    grid: Grid,
+    pieces: List[Piece],
+    check_at: int = 1,
+    sym_break: bool = False,
+) -> bool:
+    """
+    Solves a problem branching on cells instead of pieces.
+
+    At every node, the free cell covered by the fewest placements (among
+    the placements of the pieces still to position) is selected, and only
+    those placements are branched on: whatever the solution is, that cell
+    has to be filled by one of them. This is the classical
+    most-constrained-variable ordering; it keeps the branching factor low
+    and fails immediately when some free cell cannot be covered at all.
+    No transposition table here: with the deterministic cell ordering the
+    measured state overlap is essentially zero, so the lookups only cost.
+
+    Drop-in replacement for `solve_recursive` (same success contract).
+    `check_at` and `sym_break` are accepted for interface compatibility but
+    ignored: the zero-count failure test replaces the periodic solvability
+    check, and the branching order is not piece-based.
+
+    Args:
+        grid (Grid): Problem grid.
+        pieces (list): List of pieces for the problem.
+
+    Returns:
+        True if the problem can be solved. False otherwise.
+    """
+    remaining = 0
+    for piece in pieces:
+        remaining |= 1 << piece.index
+    chosen = []
+
+    cell_placements = CELL_PLACEMENTS
+    bits_list = PLACEMENT_BITS
+    type_bit = _PLACEMENT_TYPE_BIT
+    blocked = grid._blocked_bits
+    add_placement, remove_placement = grid.add_placement, grid.remove_placement
+
+    def recurse(remaining: int) -> bool:
+        if remaining == 0:
+            # No more pieces to position => Solved!
+            return True
+
+        occ = grid.bitboard | blocked
+        best_cell = -1
+        best_count = 1 << 30
+        for c in cell_placements:
+            if (occ >> c) & 1:
+                continue
+            count = 0
+            for i in cell_placements[c]:
+                if type_bit[i] & remaining and not (bits_list[i] & occ):
+                    count += 1
+                    if count >= best_count:
+                        break
+            if count < best_count:
+                if count == 0:
+                    # A free cell no remaining piece can cover
+                    return False
+                best_count = count
+                best_cell = c
+
+        if best_cell < 0:
+            # Pieces left but no free cell: unbalanced problem setup
+            return False
+
+        for i in cell_placements[best_cell]:
+            if type_bit[i] & remaining and not (bits_list[i] & occ):
+                add_placement(i)
+                chosen.append(i)
+                if recurse(remaining & ~type_bit[i]):
+                    return True
+                chosen.pop()
+                remove_placement(i)
+
+        return False
+
+    solved = recurse(remaining)
+    if solved:
+        pieces[:] = [placement_piece(i) for i in chosen]
+    return solved
+
+
+
+def _solve_root_task(grid, kinds, root_placement):
+    """
+    Worker entry point for `solve_parallel`: applies one root placement to
+    its own copy of the grid and solves the remaining pieces.
+    """
+    grid.add_placement(root_placement)
+    pieces = [get_piece(k) for k in kinds]
+    if solve_mrv(grid, pieces):
+        return pieces
+    return None
+
+
+def solve_parallel(
+    grid: Grid,
+    pieces: List[Piece],
+    check_at: int = 1,
+    sym_break: bool = False,
+    workers: Optional[int] = None,
+) -> bool:
+    """
+    Solves a problem splitting the search across worker processes.
+
+    Each feasible placement of the first piece roots a fully independent
+    subtree, so these are submitted as separate tasks (with their own copy
+    of the grid) and the first successful one wins; the sibling searches
+    still running in the workers are then terminated rather than awaited.
+    The per-task payload is tiny, so the speedup is bounded only by how
+    unevenly the work is spread across the root branches.
+
+    Same contract as `solve_recursive`; `check_at` is accepted for
+    interface compatibility (the workers run `solve_mrv`).
+
+    Args:
+        grid (Grid): Problem grid.
+        pieces (list): List of pieces for the problem.
+        check_at (int): Ignored, see above.
+        sym_break (bool): Whether the problem has rotational symmetry (see
+            Grid.has_rotational_symmetry). If so, the first piece is only
+            tried with rotation 0.
+        workers (int, optional): Number of worker processes. Default: one
+            per CPU.
+
+    Returns:
+        True if the problem can be solved. False otherwise.
+    """
+    if not pieces:
+        return True
+
+    root = placements_for_piece(
+        pieces[0].index, first_rotation_only=sym_break
+    )
+    occ = grid.bitboard | grid._blocked_bits
+    candidates = [
+        i for i in range(root.start, root.stop)
+        if not (PLACEMENT_BITS[i] & occ)
+    ]
+    kinds = [piece.index for piece in pieces[1:]]
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = {
+            executor.submit(_solve_root_task, grid, kinds, i): i
+            for i in candidates
+        }
+        for future in as_completed(futures):
+            rest = future.result()
+            if rest is not None:
+                # Replay the winning branch on the caller's grid
+                grid.add_placement(futures[future])
+                grid.add_pieces(rest)
+                pieces[0] = placement_piece(futures[future])
+                pieces[1:] = rest
+
+                # cancel_futures below only drops queued tasks: kill the
+                # sibling searches still running in the workers too, or
+                # interpreter shutdown would block on the slowest of them
+                # (shutdown drops the process references, so grab them now)
+                processes = list(executor._processes.values())
+                executor.shutdown(wait=False, cancel_futures=True)
+                for process in processes:
+                    process.terminate()
+                return True
+        return False
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+
+# === Iterative solver ===
+# Explicit-stack version of the static-order search. Kept mostly as a
+# reference implementation: the cell-based and compiled solvers above are
+# faster in practice.
+
+def config_gen(piece):
+    # A single scratch piece is moved in place through the candidate
+    # configurations; callers must clone() it before keeping a reference
+    scratch = piece.clone()
+    reset_to = scratch.reset_to
+    for rot in rot_list:
+        for x, y in xy_pairs:
+            reset_to(x, y, rot)
+            yield scratch
+
+def search_piece_position(grid, generator):
+    for piece in generator:
+        if grid.add_piece(piece):
+            return piece, generator
+    return None
+
+
+def solve_iter(grid, pieces, check_at=1, check_every=1) -> bool:
+    """
+    Iterative version of `solve_recursive`.
+
+    The solvability check runs after a successful placement once `check_at`
+    pieces are down, but only every `check_every` depths. Sparser checking
+    was meant to amortize an expensive check; with the compiled check it
+    measures strictly slower (skipped prunes cost more than the calls
+    save), so the default checks at every depth like the recursive solver.
+    """
+    generators = [config_gen(piece) for piece in pieces]
+    idx = 0
+
+    while idx < len(pieces):
+        piece, gen = pieces[idx], generators[idx]
+        res = search_piece_position(grid, gen)
+
+        if res is not None:
+            # If a position is found
+            if (
+                idx >= check_at and idx % check_every == 0
+                and grid.is_impossible()
+            ):
+                grid.remove_piece(res[0])
+                continue
+
+            pieces[idx] = res[0].clone()
+            generators[idx] = res[1]
+            idx += 1
+
+        else:
+            # If no position is found
+            if idx == 0:
+                return False
+
+            generators[idx] = config_gen(piece)
+            idx -= 1
+            grid.remove_piece(pieces[idx])
+
+    return True
+
+# === Iterative solver ===
+
+
+
+def prepare_problem(filename: str) -> Tuple[Grid, List[Piece]]:
+    """
+    Loads a problem from a YAML configuration file.
+
+    The config file should contain the following entries:
+
+    - 'blocked_grid_cells': This should be a list of (x, y) couples 
+      corresponding to the x and y coordinates of the blocked grid cells.
+
+    - 'excluded_pieces': This should be a list of indexes corresponding to the 
+      indexes of the pieces that should be excluded when solving the problem.
+      Can be empty.
+
+    Args:
+        filename (str): Configuration file name (yaml).
+    
+    Returns:
+        Grid, List: Starting grid and list of available pieces.
+    """
+    with open(filename, "r") as fp:
+        problem_conf = yaml.load(fp, Loader=_YamlLoader)
+    
+    grid = Grid()
+    for x, y in problem_conf["blocked_grid_cells"]:
+        grid.block_cell(x, y)
+    assert not grid.is_impossible()
+
+
+    pieces = [
+        get_piece(i)
+        for i in range(1, NUM_PIECES+1)
+        if i not in problem_conf.get("excluded_pieces", ())
+    ]
+
+    return grid, pieces
+
+
+def save_solution_to_config(pieces: List[Piece], filename: str):
+    """
+    Save a set of pieces as solution in the configuration file. If a solution 
+    already exists in the config file, this does nothing.
+
+    The existence test is a plain byte scan for a top-level `solution:` key,
+    so the file is not parsed a second time after `prepare_problem`.
+
+    Args:
+        pieces (list): List of pieces (supposedly solving the problem).
+        filename (str): Problem configuration file (yaml).
+    """
+    with open(filename, "r+b") as fp:
+        content = fp.read()
+        if content.startswith(b"solution:") or b"\nsolution:" in content:
+            return
+
+        solution  = {
+            piece.index: {
+                "base_x": piece.base_x,
+                "base_y": piece.base_y,
+                "rotation": piece.rotation,
+            }
+            for piece in pieces
+        }
+        if content and not content.endswith(b"\n"):
+            # Appending straight after a line without a trailing newline
+            # would glue the new key to it and corrupt the file
+            fp.write(b"\n")
+        fp.write(yaml.dump(
+            {"solution": solution}, Dumper=_YamlDumper
+        ).encode())
+
+
+
+def solve(
+    filename: str,
+    seed: Optional[int] = None,
+    check_at: int = 1,
+    save_solution: bool = True,
+    use_iterative: bool = False,
+    workers: Optional[int] = None,
+    show_plot: bool = True,
+    quiet: bool = False,
+):
+    """
+    Solves a problem.
+
+    The problem is loaded from a configuration file containing the initial 
+    grid configuration (in terms of blocked cells) and the available pieces.
+
+    Args:
+        filename (str): Problem configuration file (yaml).
+        seed (int, optional): Seed for the random number generator. If
+            given, the pieces are shuffled with it; otherwise they are
+            ordered most-constrained first (fewest placements in the
+            table). Default: None.
+        check_at (int): Number of pieces placed after which starting to check 
+            if the grid is solvable. Default: 1.
+        save_solution (bool): Whether to save the solution in the input config 
+            file (if not already present). Default: True.
+        use_iterative (bool): Ignored.
+        workers (int, optional): If given and greater than 1, the root
+            branches of the search are solved in that many worker processes
+            (see solve_parallel). Default: None (solve in-process).
+        show_plot (bool): Whether to draw the final grid. Matplotlib is
+            only imported when this is on, keeping the solver's startup
+            free of the plotting stack. Default: True.
+        quiet (bool): Suppress the progress/timing prints (for batch
+            runs). Default: False.
+    """
+
+    grid, pieces = prepare_problem(filename)
+    if seed is not None:
+        # Randomized order, kept for exploring alternative solutions and
+        # for benchmarking comparisons
+        random.seed(seed)
+        random.shuffle(pieces)
+    else:
+        # Most-constrained piece first: fewer table placements means a
+        # smaller fan-out at the shallow depths, where dead ends are
+        # cheapest (2-30x on the static-order solvers; the cell-based
+        # solver picks its own order and is unaffected)
+        def num_placements(piece: Piece) -> int:
+            table_range = placements_for_piece(piece.index)
+            return table_range.stop - table_range.start
+        pieces.sort(key=num_placements)
+    sym_break = grid.has_rotational_symmetry()
+
+    # solver = solve_iter if use_iterative else solve_recursive
+    # The cell-based solver explores orders of magnitude fewer nodes than
+    # the static piece-order solvers (compiled kernel included); the kernel
+    # and solve_recursive remain available for the static order
+    solver = solve_mrv
+
+    if not quiet:
+        print("Starting to solve problem...")
+    # perf_counter: monotonic, unaffected by clock adjustments. The timed
+    # region covers the search only (the plotting below is untimed)
+    start = time.perf_counter()
+    if workers is not None and workers > 1:
+        solved = solve_parallel(
+            grid, pieces, check_at=check_at, sym_break=sym_break,
+            workers=workers,
+        )
+    else:
+        solved = solver(grid, pieces, check_at=check_at, sym_break=sym_break)
+    end = time.perf_counter()
+    if not quiet:
+        print(f"Ended in: {end - start:.2f} seconds")
+        if not solved:
+            print("The problem could not be solved! :'(")
+        else:
+            print("Problem solved! :D")
+
+    if solved and save_solution:
+        save_solution_to_config(pieces, filename)
+
+    if show_plot:
+        import matplotlib.pyplot as plt
+
+        fig, ax = plt.subplots(1, 1, figsize=(6, 6))
+        grid.draw(ax=ax)
+        ax.set(xlim=(2, 23), ylim=(-3, 18))
+        ax.set_aspect("equal")
+        plt.axis("off")
+        plt.tight_layout()
+        plt.show()
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Solves a problem.")
+    parser.add_argument(
+        "config_file", help="Problem configuration file (YAML)"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Seed for the piece shuffle"
+    )
+    parser.add_argument(
+        "--check-at", type=int, default=1,
+        help="Index from which checking if the current grid is solvable",
+    )
+    parser.add_argument(
+        "--no-save-solution", action="store_false", dest="save_solution",
+        help="Do not save the solution in the input config file"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Solve the root branches in this many worker processes",
+    )
+    parser.add_argument(
+        "--no-plot", action="store_false", dest="show_plot",
+        help="Do not draw the final grid"
+    )
+    parser.add_argument(
+        "--quiet", action="store_true",
+        help="Suppress the progress and timing prints"
+    )
+
+    args = parser.parse_args()
+
+    solve(
+        filename=args.config_file,
+        seed=args.seed,
+        check_at=args.check_at,
+        save_solution=args.save_solution,
+        workers=args.workers,
+        show_plot=args.show_plot,
+        quiet=args.quiet,
+    )
@@ -0,0 +1,97 @@
+"""
+ctypes-backed backtracking solver.
+
+Same static-order search as the Numba kernel in `solve_nb.py`, but running
+in the small C extension compiled from `_ccl.c`, for deployments without
+Numba. `grid.py` only builds the extension when Numba is missing, so when
+the compiled kernel is available this module fails to import (and is not
+needed).
+
+`solve.py` guards the import and falls back to the pure-Python solvers
+when neither compiled path exists.
+"""
+
+from typing import List
+
+import numpy as np
+
+from grid import (
+    Grid,
+    PLACEMENT_CELLS,
+    placement_piece,
+    placements_for_piece,
+    _ccl_solve,
+)
+from pieces import N, NUM_PIECES, Piece
+
+if _ccl_solve is None:
+    raise ImportError("the C solver extension is not available")
+
+
+# Placement components as linear cell ids, and the placement table range of
+# each piece type, in the flat int32 layout the C entry point expects
+_P_CELLS = np.ascontiguousarray(
+    PLACEMENT_CELLS[:, :, 1].astype(np.int32) * N
+    + PLACEMENT_CELLS[:, :, 0]
+)
+_KIND_START = np.zeros(NUM_PIECES + 2, dtype=np.int32)
+for _index in range(1, NUM_PIECES + 1):
+    _slice = placements_for_piece(_index)
+    _KIND_START[_index] = _slice.start
+    _KIND_START[_index + 1] = _slice.stop
+
+
+def solve_ccl(
+    grid: Grid,
+    pieces: List[Piece],
+    check_at: int = 1,
+    sym_break: bool = False,
+) -> bool:
+    """
+    Solves a problem with the C search entry point.
+
+    Drop-in replacement for `solve_recursive`: on success, the grid
+    contains the final piece configuration and `pieces` the concrete pieces
+    solving the problem.
+
+    Args:
+        grid (Grid): Problem grid.
+        pieces (list): List of pieces for the problem.
+        check_at (int): Index from which checking if the grid is solvable.
+            See grid.is_impossible() for details.
+        sym_break (bool): Whether the problem has rotational symmetry (see
+            Grid.has_rotational_symmetry). If so, the first piece is only
+            tried with rotation 0.
+
+    Returns:
+        True if the problem can be solved. False otherwise.
+    """
+    if not pieces:
+        return True
+
+    kinds = np.array([piece.index for piece in pieces], dtype=np.int32)
+    chosen = np.full(len(pieces), -1, dtype=np.int32)
+    root = placements_for_piece(
+        int(kinds[0]), first_rotation_only=sym_break
+    )
+    grid_flat = grid.grid.ravel()
+
+    solved = _ccl_solve(
+        grid_flat.ctypes.data, kinds.ctypes.data,
+        len(pieces), check_at, root.start, root.stop,
+        _P_CELLS.ctypes.data, _KIND_START.ctypes.data,
+        grid._nb_arr.ctypes.data, grid._nb_cnt.ctypes.data,
+        N * N, chosen.ctypes.data,
+    )
+    if solved < 0:
+        raise ValueError("problem does not fit the C solver's fixed limits")
+
+    if solved:
+        # The C search only updates the grid matrix: rebuild the concrete
+        # pieces and bring the bitboard back in sync
+        for index, i in enumerate(chosen):
+            piece = placement_piece(int(i))
+            pieces[index] = piece
+            grid.bitboard |= piece.bits
+
+    return bool(solved)
@@ -0,0 +1,186 @@
+"""
+Numba-compiled backtracking solver.
+
+This mirrors `solve.solve_recursive`, but runs the whole recursion as a
+compiled kernel over the pre-computed placement table: candidate placements
+are enumerated by integer index, the placement test and the grid updates are
+plain integer loops, and the solvability pruning reuses the compiled DFS
+kernels from `grid.py`. No Python object is touched inside the search.
+
+Importing this module requires Numba; `solve.py` guards the import and falls
+back to the pure-Python solver when it fails.
+"""
+
+from typing import List
+
+import numpy as np
+from numba import njit
+
+from grid import (
+    FREE,
+    Grid,
+    PLACEMENT_CELLS,
+    placement_piece,
+    placements_for_piece,
+    _impossible_dfs,
+    _impossible_dfs_seeded,
+)
+from pieces import N, NUM_PIECES, Piece
+
+
+# Placement components as linear cell ids, and the placement table range of
+# each piece type (placements of type `t` are rows KIND_START[t] to
+# KIND_START[t+1] of the table)
+_P_CELLS = (
+    PLACEMENT_CELLS[:, :, 1].astype(np.int32) * N
+    + PLACEMENT_CELLS[:, :, 0]
+)
+_KIND_START = np.zeros(NUM_PIECES + 2, dtype=np.int32)
+for _index in range(1, NUM_PIECES + 1):
+    _slice = placements_for_piece(_index)
+    _KIND_START[_index] = _slice.start
+    _KIND_START[_index + 1] = _slice.stop
+
+
+@njit(cache=True)
+def _check_impossible(
+    grid_flat, nb_arr, nb_cnt, stack, visited, gen_arr, seeds, seeded,
+):
+    """Runs the (possibly seeded) solvability check, ticking the counter."""
+    gen_arr[0] += 1
+    if gen_arr[0] == 65536:
+        # Generation counter wrapped around: actually clear the buffer
+        visited[:] = 0
+        gen_arr[0] = 1
+    if seeded:
+        return _impossible_dfs_seeded(
+            grid_flat, nb_arr, nb_cnt, stack, visited, gen_arr[0], seeds
+        )
+    return _impossible_dfs(
+        grid_flat, nb_arr, nb_cnt, stack, visited, gen_arr[0]
+    )
+
+
+@njit(cache=True)
+def _solve_kernel(
+    grid_flat, kinds, check_at, root_start, root_stop,
+    p_cells, kind_start, nb_arr, nb_cnt, stack, visited, gen_arr, chosen,
+):
+    """
+    Search kernel. Explores the same tree in the same order as
+    `solve.solve_recursive`, but as an explicit backtracking loop (Numba
+    does not handle the deep recursion reliably): `cursor[d]` is the
+    placement currently tried for the piece at depth `d`. After a piece is
+    placed, the solvability check runs exactly as on entering the
+    corresponding recursion level, seeded with the placed piece past the
+    first check. On success, the chosen placement indexes are in `chosen`.
+
+    The first piece only scans placements `root_start` to `root_stop`;
+    callers restrict this range on symmetric problems to break symmetry.
+    """
+    n = kinds.shape[0]
+    if n == 0:
+        return True
+
+    if check_at <= 0 and _check_impossible(
+        grid_flat, nb_arr, nb_cnt, stack, visited, gen_arr, p_cells[0], False
+    ):
+        return False
+
+    cursor = np.empty(n, np.int32)
+    index = 0
+    cursor[0] = root_start
+
+    while True:
+        kind = kinds[index]
+        i = cursor[index]
+        end = root_stop if index == 0 else kind_start[kind + 1]
+        placed = False
+
+        while i < end:
+            free = True
+            for k in range(5):
+                if grid_flat[p_cells[i, k]] != FREE:
+                    free = False
+                    break
+            if free:
+                for k in range(5):
+                    grid_flat[p_cells[i, k]] = kind
+                if index + 1 >= check_at and _check_impossible(
+                    grid_flat, nb_arr, nb_cnt, stack, visited, gen_arr,
+                    p_cells[i], index + 1 > check_at,
+                ):
+                    for k in range(5):
+                        grid_flat[p_cells[i, k]] = FREE
+                else:
+                    placed = True
+                    break
+            i += 1
+
+        if placed:
+            cursor[index] = i
+            chosen[index] = i
+            index += 1
+            if index == n:
+                # No more pieces to position => Solved!
+                return True
+            cursor[index] = kind_start[kinds[index]]
+        else:
+            # No (more) placements fit at this depth: backtrack
+            index -= 1
+            if index < 0:
+                return False
+            j = cursor[index]
+            for k in range(5):
+                grid_flat[p_cells[j, k]] = FREE
+            cursor[index] = j + 1
+
+
+def solve_numba(
+    grid: Grid,
+    pieces: List[Piece],
+    check_at: int = 1,
+    sym_break: bool = False,
+) -> bool:
+    """
+    Solves a problem with the compiled search kernel.
+
+    Drop-in replacement for `solve.solve_recursive`: on success, the grid
+    contains the final piece configuration and `pieces` the concrete pieces
+    solving the problem.
+
+    Args:
+        grid (Grid): Problem grid.
+        pieces (list): List of pieces for the problem.
+        check_at (int): Index from which checking if the grid is solvable.
+            See grid.is_impossible() for details.
+        sym_break (bool): Whether the problem has rotational symmetry (see
+            Grid.has_rotational_symmetry). If so, the first piece is only
+            tried with rotation 0.
+
+    Returns:
+        True if the problem can be solved. False otherwise.
+    """
+    kinds = np.array([piece.index for piece in pieces], dtype=np.int64)
+    chosen = np.full(len(pieces), -1, dtype=np.int32)
+    gen_arr = np.array([grid._gen], dtype=np.int64)
+    root = placements_for_piece(
+        int(kinds[0]), first_rotation_only=sym_break
+    ) if len(pieces) else slice(0, 0)
+
+    solved = bool(_solve_kernel(
+        grid.grid.ravel(), kinds, check_at, root.start, root.stop,
+        _P_CELLS, _KIND_START, grid._nb_arr, grid._nb_cnt,
+        grid._stack, grid._visited, gen_arr, chosen,
+    ))
+    grid._gen = int(gen_arr[0])
+
+    if solved:
+        # The kernel only updates the grid matrix: rebuild the concrete
+        # pieces and bring the bitboard back in sync
+        for index, i in enumerate(chosen):
+            piece = placement_piece(int(i))
+            pieces[index] = piece
+            grid.bitboard |= piece.bits
+
+    return solved
@@ -0,0 +1,48 @@
+"""
+Smoke test: solves a small problem end to end with each solver and checks
+the resulting grid is consistent with the returned pieces. No plotting, no
+solution saving.
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid import FREE
+from solve import prepare_problem, solve_mrv, solve_recursive
+
+PROBLEM = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "problems", "test", "8_pieces_v1.yaml",
+)
+
+SOLVERS = [solve_mrv, solve_recursive]
+try:
+    from solve_nb import solve_numba
+    SOLVERS.append(solve_numba)
+except ImportError:
+    pass
+try:
+    from solve_c import solve_ccl
+    SOLVERS.append(solve_ccl)
+except ImportError:
+    pass
+
+
+@pytest.mark.parametrize("solver", SOLVERS, ids=lambda s: s.__name__)
+def test_solver_smoke(solver):
+    grid, pieces = prepare_problem(PROBLEM)
+    random.seed(0)
+    random.shuffle(pieces)
+
+    assert solver(grid, pieces, check_at=1)
+
+    # Every cell filled, and the grid mirrors the returned pieces
+    assert not (grid.grid == FREE).any()
+    for piece in pieces:
+        for x, y in piece:
+            assert grid.grid[y, x] == piece.index